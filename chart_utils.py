@@ -0,0 +1,79 @@
+"""
+Chart data helpers shared by the modular and the monolithic dashboards.
+
+Only NumPy and Plotly are needed here, so either app can import this module
+without pulling in the other's Streamlit components.
+"""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Largest number of points sent to the browser per line trace
+MAX_LINE_POINTS = 2000
+
+def lttb_indices(x, y, max_points):
+    """Return row positions that downsample (x, y) with Largest-Triangle-Three-Buckets"""
+    n_points = len(y)
+    if n_points <= max_points or max_points < 3:
+        return np.arange(n_points)
+    
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # First and last points are kept; the rest is split into max_points - 2 buckets
+    edges = np.linspace(1, n_points - 1, max_points - 1).astype(np.int64)
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n_points - 1
+    
+    selected = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n_points
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(area.argmax())
+        keep[bucket + 1] = selected
+    
+    return keep
+
+# Heatmaps with more cells than this are sent to the browser as one shaded image
+MAX_HEATMAP_CELLS = 2500
+
+def shade_matrix(matrix, colorscale, zmin, zmax):
+    """Map a 2-D array to an RGB image through a Plotly colorscale; NaN cells are white"""
+    lut = np.array([px.colors.unlabel_rgb(color)
+                    for color in px.colors.sample_colorscale(colorscale, np.linspace(0, 1, 256))], dtype=np.uint8)
+    scaled = np.clip((matrix - zmin) / ((zmax - zmin) or 1.0), 0, 1)
+    image = lut[np.nan_to_num(scaled * 255).astype(np.uint8)]
+    image[np.isnan(matrix)] = 255
+    return image
+
+def image_heatmap(data, colorscale, title, aspect=None):
+    """Draw a labelled DataFrame as one PNG heatmap that still hovers its values and shows a colorbar"""
+    values = data.to_numpy(dtype=np.float64)
+    zmin, zmax = np.nanmin(values), np.nanmax(values)
+    image = shade_matrix(values, colorscale, zmin, zmax)
+    fig = px.imshow(image, binary_string=True, title=title, aspect=aspect)
+    fig.update_xaxes(tickmode='array', tickvals=np.arange(values.shape[1]), ticktext=[str(col) for col in data.columns])
+    fig.update_yaxes(tickmode='array', tickvals=np.arange(values.shape[0]), ticktext=[str(row) for row in data.index])
+    
+    # The PNG only holds colours, so the hover reads each cell's labels and value from customdata
+    cells = np.empty(values.shape + (3,), dtype=object)
+    cells[..., 0] = np.asarray([str(row) for row in data.index], dtype=object)[:, None]
+    cells[..., 1] = np.asarray([str(col) for col in data.columns], dtype=object)[None, :]
+    cells[..., 2] = values
+    fig.update_traces(customdata=cells, hovertemplate='%{customdata[0]}, %{customdata[1]}: %{customdata[2]:.4~g}<extra></extra>',
+                      selector=dict(type='image'))
+    
+    # An empty marker trace carries the colorbar that an image trace cannot show
+    fig.add_trace(go.Scatter(x=[None], y=[None], mode='markers', hoverinfo='skip', showlegend=False,
+                             marker=dict(colorscale=colorscale, cmin=zmin, cmax=zmax, color=[zmin], showscale=True)))
+    return fig
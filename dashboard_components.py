@@ -1,83 +1,33 @@
+import functools
+import hashlib
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from chart_utils import MAX_HEATMAP_CELLS, MAX_LINE_POINTS, image_heatmap, lttb_indices
 import warnings
 warnings.filterwarnings('ignore')
 
-class DashboardComponents:
-    """Class containing all dashboard components and utility functions"""
-    
-    @staticmethod
-    def get_css_styles():
-        """Return custom CSS styles for the dashboard"""
-        return """
-        <style>
-            .main-header {
-                font-size: 3rem;
-                font-weight: bold;
-                color: #1f77b4;
-                text-align: center;
-                margin-bottom: 2rem;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-            }
-            .metric-card {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                padding: 1rem;
-                border-radius: 10px;
-                color: white;
-                text-align: center;
-                margin: 0.5rem 0;
-            }
-            .prediction-card {
-                background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-                padding: 1rem;
-                border-radius: 10px;
-                color: white;
-                text-align: center;
-                margin: 0.5rem 0;
-            }
-            .sidebar .sidebar-content {
-                background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-            }
-            .stButton > button {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0.5rem 1rem;
-                font-weight: bold;
-                transition: all 0.3s ease;
-                margin: 0.2rem 0;
-            }
-            .stButton > button:hover {
-                background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-                transform: translateY(-2px);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            }
-            .stButton > button:active {
-                transform: translateY(0);
-            }
-        </style>
-        """
-    
-    @staticmethod
-    def create_metric_card(title, value, subtitle=""):
-        """Create a metric card with custom styling"""
-        return f"""
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')
+
+@st.cache_data(show_spinner=False)
+def _read_css(path):
+    """Read the dashboard stylesheet once per process"""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+# HTML card templates, filled with str.format_map
+_METRIC_CARD_TEMPLATE = """
         <div class="metric-card">
             <h3>{title}</h3>
             <h2>{value}</h2>
-            {f'<p>{subtitle}</p>' if subtitle else ''}
+            {subtitle}
         </div>
         """
-    
-    @staticmethod
-    def create_algorithm_card(title, algorithm, accuracy, purpose, benefit, gradient_colors):
-        """Create an algorithm card with custom styling"""
-        return f"""
+
+_ALGORITHM_CARD_TEMPLATE = """
         <div style="background: linear-gradient(135deg, {gradient_colors}); padding: 1.5rem; border-radius: 15px; color: white; margin: 1rem 0;">
             <h3>{title}</h3>
             <p><strong>Algorithm:</strong> {algorithm}</p>
@@ -86,52 +36,202 @@ class DashboardComponents:
             <p><strong>Key Benefit:</strong> {benefit}</p>
         </div>
         """
-    
-    @staticmethod
-    def create_action_card(title, actions, gradient_colors):
-        """Create an action card for prevention strategies"""
-        actions_html = "".join([f"<p>• {action}</p>" for action in actions])
-        return f"""
+
+_ACTION_CARD_TEMPLATE = """
         <div style="background: linear-gradient(135deg, {gradient_colors}); padding: 1rem; border-radius: 10px; color: white;">
             <h4>{title}</h4>
             {actions_html}
         </div>
         """
 
+class DashboardComponents:
+    """Class containing all dashboard components and utility functions"""
+    
+    @staticmethod
+    def get_css_styles():
+        """Return custom CSS styles for the dashboard"""
+        return f"<style>\n{_read_css(CSS_PATH)}</style>"
+    
+    @staticmethod
+    def create_metric_card(title, value, subtitle=""):
+        """Create a metric card with custom styling"""
+        return _METRIC_CARD_TEMPLATE.format_map({
+            'title': title,
+            'value': value,
+            'subtitle': f'<p>{subtitle}</p>' if subtitle else ''
+        })
+    
+    @staticmethod
+    def create_algorithm_card(title, algorithm, accuracy, purpose, benefit, gradient_colors):
+        """Create an algorithm card with custom styling"""
+        return _ALGORITHM_CARD_TEMPLATE.format_map({
+            'title': title,
+            'algorithm': algorithm,
+            'accuracy': accuracy,
+            'purpose': purpose,
+            'benefit': benefit,
+            'gradient_colors': gradient_colors
+        })
+    
+    @staticmethod
+    def create_action_card(title, actions, gradient_colors):
+        """Create an action card for prevention strategies"""
+        return _ACTION_CARD_TEMPLATE.format_map({
+            'title': title,
+            'actions_html': "".join(f"<p>• {action}</p>" for action in actions),
+            'gradient_colors': gradient_colors
+        })
+
+_META_COLUMNS = frozenset({'Date', 'Unit', 'Year', 'Month'})
+
+@functools.lru_cache(maxsize=32)
+def _crime_columns(columns):
+    """Crime type columns for a tuple of column names"""
+    return tuple(col for col in columns if col not in _META_COLUMNS)
+
+def get_crime_columns(df):
+    """Return the crime type columns of df as a tuple, memoized on its column names"""
+    return _crime_columns(tuple(df.columns))
+
 class DataProcessor:
     """Class for data processing and manipulation"""
     
     def __init__(self, df):
         self.df = df
-        self.crime_columns = [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
+        self.crime_columns = list(get_crime_columns(df))
+        
+        # Precompute aggregates once; the getters below only slice them
+        self._totals = self._downcast_counts(df[self.crime_columns].sum().sort_values(ascending=False))
+        self._monthly = self._monthly_sums(df, self.crime_columns)
+        self._by_unit = self._downcast_counts(df.groupby('Unit', sort=False, observed=True)[self.crime_columns].sum())
+        self._by_year = self._downcast_counts(df.groupby('Year')[self.crime_columns].sum())
+        self._by_date = self._downcast_counts(df.groupby('Date')[self.crime_columns].sum())
+        self._by_unit_year = self._downcast_counts(df.groupby(['Unit', 'Year'], observed=True)[self.crime_columns].sum())
+        self._corr = self._correlation_matrix(df, self.crime_columns)
+        self._years = tuple(np.unique(df['Year']).tolist())
+    
+    @staticmethod
+    def _downcast_counts(counts):
+        """Store integer sums as int32 when they fit; pandas widens them to 64-bit"""
+        values = counts.to_numpy()
+        if np.issubdtype(values.dtype, np.integer) and values.size and values.max() <= np.iinfo(np.int32).max:
+            return counts.astype(np.int32)
+        return counts
+    
+    @staticmethod
+    def _group_sum(codes, values, n_groups):
+        """Sum the columns of values per dense integer group code, one np.bincount pass per column"""
+        return np.column_stack([
+            np.bincount(codes, weights=values[:, col], minlength=n_groups)
+            for col in range(values.shape[1])
+        ])
+    
+    @classmethod
+    def _monthly_sums(cls, df, crime_columns):
+        """Sum crime counts per (Year, Month) over pre-factorized integer month codes"""
+        first_year = int(df['Year'].min())
+        month_codes = (df['Year'].to_numpy(dtype=np.int64) - first_year) * 12 + df['Month'].to_numpy(dtype=np.int64) - 1
+        n_groups = int(month_codes.max()) + 1
+        
+        crime_values = df[crime_columns].to_numpy()
+        sums = cls._group_sum(month_codes, crime_values, n_groups)
+        if np.issubdtype(crime_values.dtype, np.integer):
+            # bincount accumulates in float64, which is exact for counts
+            sums = sums.astype(np.int64)
+        
+        # Keep only the months that occur in the data
+        codes = np.flatnonzero(np.bincount(month_codes, minlength=n_groups))
+        index = pd.MultiIndex.from_arrays([codes // 12 + first_year, codes % 12 + 1], names=['Year', 'Month'])
+        monthly = cls._downcast_counts(pd.DataFrame(sums[codes], index=index, columns=crime_columns))
+        
+        # First day of each month, materialized once for the trend charts
+        monthly['Date'] = (np.datetime64(f'{first_year}-01', 'M') + codes).astype('datetime64[ns]')
+        return monthly
+    
+    @staticmethod
+    def _correlation_matrix(df, crime_columns):
+        """Pearson correlation of all crime columns as a single standardized matrix product"""
+        values = df[crime_columns].to_numpy(dtype=np.float64, copy=True)
+        values -= values.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Constant columns become NaN, as with DataFrame.corr
+            values /= values.std(axis=0)
+        corr = (values.T @ values) / len(values)
+        return pd.DataFrame(corr, index=crime_columns, columns=crime_columns)
+    
+    def get_years(self):
+        """Get the sorted years present in the data"""
+        return self._years
     
     def get_crime_totals(self):
         """Get total crimes by type"""
-        return self.df[self.crime_columns].sum().sort_values(ascending=False)
+        return self._totals
     
     def get_monthly_data(self, start_year, end_year):
         """Get monthly data for specified year range"""
-        filtered_df = self.df[(self.df['Year'] >= start_year) & (self.df['Year'] <= end_year)]
-        return filtered_df.groupby(['Year', 'Month'])[self.crime_columns].sum().reset_index()
+        return self._monthly.loc[start_year:end_year].reset_index()
+    
+    def get_yearly_data(self, start_year, end_year):
+        """Get yearly totals for specified year range"""
+        return self._by_year.loc[start_year:end_year]
     
     def get_unit_data(self, crime_type):
         """Get unit-wise data for specific crime type"""
-        return self.df.groupby('Unit')[crime_type].sum().sort_values(ascending=False)
+        return self._by_unit[crime_type].sort_values(ascending=False)
+    
+    def get_unit_year_data(self, crime_type):
+        """Get crime totals per unit (rows) and year (columns) for a crime type"""
+        return self._by_unit_year[crime_type].unstack(fill_value=0)
+    
+    def get_unit_comparison(self, selected_crimes):
+        """Get per-unit totals for the selected crimes"""
+        return self._by_unit[selected_crimes].sort_index()
     
     def get_correlation_matrix(self, selected_crimes):
         """Get correlation matrix for selected crimes"""
-        return self.df[selected_crimes].corr()
+        return self._corr.loc[selected_crimes, selected_crimes]
     
     def get_time_series_data(self, selected_crimes):
         """Get time series data for selected crimes"""
-        ts_data = self.df.groupby('Date')[selected_crimes].sum().reset_index()
-        ts_data['Date'] = pd.to_datetime(ts_data['Date'])
-        return ts_data
+        return self._by_date[selected_crimes].reset_index()
+
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def get_data_processor(df):
+    """Return a DataProcessor for df, built once and shared across reruns"""
+    return DataProcessor(df)
+
+def _frame_hash(obj):
+    """Hash a DataFrame or Series to a short digest of its labels and values"""
+    labels = tuple(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(obj, index=True).values.tobytes(), digest_size=16)
+    digest.update(repr(labels).encode())
+    return digest.hexdigest()
+
+def cached_figure(builder):
+    """Memoize a chart builder on its inputs, caching the figure as a plain dict"""
+    @functools.wraps(builder)
+    def build_figure_dict(*args, **kwargs):
+        return builder(*args, **kwargs).to_dict()
+    
+    build_figure_dict = st.cache_data(
+        hash_funcs={pd.DataFrame: _frame_hash, pd.Series: _frame_hash},
+        show_spinner=False
+    )(build_figure_dict)
+    
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        return go.Figure(build_figure_dict(*args, **kwargs))
+    
+    return wrapper
 
 class ChartGenerator:
     """Class for generating various charts and visualizations"""
     
+    # Bar colors for the five algorithm and achievement categories
+    CATEGORY_COLORS = ['#667eea', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
+    
     @staticmethod
+    @cached_figure
     def create_crime_distribution_chart(crime_totals):
         """Create crime distribution bar chart"""
         fig = px.bar(
@@ -146,16 +246,19 @@ class ChartGenerator:
         return fig
     
     @staticmethod
+    @cached_figure
     def create_monthly_trend_chart(monthly_data, selected_crime, start_year, end_year):
         """Create monthly trend chart"""
-        monthly_data['Date'] = pd.to_datetime(monthly_data[['Year', 'Month']].assign(day=1))
+        keep = lttb_indices(monthly_data['Date'], monthly_data[selected_crime], MAX_LINE_POINTS)
+        monthly_data = monthly_data.iloc[keep]
         fig = px.line(monthly_data, x='Date', y=selected_crime, 
                       title=f'Monthly {selected_crime} Trends ({start_year}-{end_year})',
-                      markers=True)
+                      markers=True, render_mode='webgl')
         fig.update_layout(height=500)
         return fig
     
     @staticmethod
+    @cached_figure
     def create_yearly_comparison_chart(yearly_data):
         """Create yearly comparison chart"""
         fig = px.bar(yearly_data, title="Yearly Crime Comparison")
@@ -163,6 +266,7 @@ class ChartGenerator:
         return fig
     
     @staticmethod
+    @cached_figure
     def create_unit_analysis_chart(unit_data, crime_type):
         """Create unit analysis chart"""
         fig = px.bar(x=unit_data.index, y=unit_data.values,
@@ -172,6 +276,7 @@ class ChartGenerator:
         return fig
     
     @staticmethod
+    @cached_figure
     def create_heatmap_chart(heatmap_data, crime_type):
         """Create heatmap chart"""
         fig = px.imshow(heatmap_data, 
@@ -181,110 +286,236 @@ class ChartGenerator:
         return fig
     
     @staticmethod
+    @cached_figure
     def create_time_series_comparison(ts_data, selected_crimes):
         """Create time series comparison chart"""
         fig = go.Figure()
         for crime in selected_crimes:
-            fig.add_trace(go.Scatter(x=ts_data['Date'], y=ts_data[crime], 
+            keep = lttb_indices(ts_data['Date'], ts_data[crime], MAX_LINE_POINTS)
+            fig.add_trace(go.Scattergl(x=ts_data['Date'].iloc[keep], y=ts_data[crime].iloc[keep], 
                                    mode='lines+markers', name=crime))
         fig.update_layout(title="Crime Trends Over Time", height=500)
         return fig
     
     @staticmethod
+    @cached_figure
     def create_correlation_heatmap(correlation_matrix):
         """Create correlation heatmap"""
-        fig = px.imshow(correlation_matrix, 
-                        title="Correlation Matrix of Selected Crime Types",
-                        color_continuous_scale='RdBu_r')
+        title = "Correlation Matrix of Selected Crime Types"
+        if correlation_matrix.size > MAX_HEATMAP_CELLS:
+            fig = image_heatmap(correlation_matrix, 'RdBu_r', title)
+        else:
+            fig = px.imshow(correlation_matrix, 
+                            title=title,
+                            color_continuous_scale='RdBu_r')
         fig.update_layout(height=500)
         return fig
     
     @staticmethod
+    @cached_figure
     def create_unit_comparison_chart(unit_comparison):
         """Create unit comparison chart"""
         fig = px.bar(unit_comparison, title="Crime Comparison Across Units")
         fig.update_layout(height=500)
         return fig
+    
+    @staticmethod
+    def create_prediction_chart(top_5_crimes, prediction_unit, prediction_month, prediction_year):
+        """Create top 5 predictions bar chart"""
+        # Predictions carry random noise, so caching them would only fill the cache
+        fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
+                    title=f'Top 5 Crime Predictions for {prediction_unit} - {pd.Timestamp(2020, prediction_month, 1).strftime("%B")} {prediction_year}',
+                    labels={'x': 'Crime Type', 'y': 'Predicted Cases'})
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    def create_prediction_distribution_chart(top_5_crimes):
+        """Create prediction distribution pie chart"""
+        fig = px.pie(values=top_5_crimes.values, names=top_5_crimes.index,
+                    title="Prediction Distribution")
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    @cached_figure
+    def create_recent_trend_chart(recent_trend, prediction_unit):
+        """Create historical trend chart for a unit"""
+        return px.bar(x=recent_trend.index, y=recent_trend.values,
+                      title=f"Historical Crime Trends for {prediction_unit} (Last 24 Months)")
+    
+    @staticmethod
+    @cached_figure
+    def create_top_crimes_chart(top_5_crimes):
+        """Create top 5 crime types chart"""
+        fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
+                     title="Top 5 Crime Types by Volume",
+                     color=top_5_crimes.values,
+                     color_continuous_scale='viridis')
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    @cached_figure
+    def create_crime_share_chart(crime_percentages):
+        """Create crime distribution pie chart"""
+        fig = px.pie(values=crime_percentages.values, names=crime_percentages.index,
+                     title="Crime Distribution (%)")
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    @cached_figure
+    def create_resource_allocation_chart(resource_allocation):
+        """Create resource allocation chart"""
+        fig = px.bar(x=resource_allocation.index, y=resource_allocation.values,
+                     title="Recommended Resource Allocation (%)",
+                     color=resource_allocation.values,
+                     color_continuous_scale='plasma')
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    @cached_figure
+    def create_algorithm_comparison_chart(metrics_df):
+        """Create algorithm performance comparison chart"""
+        fig = px.bar(metrics_df, x='Algorithm', y='Accuracy/Score', 
+                     color='Algorithm', title="Algorithm Performance Comparison",
+                     color_discrete_sequence=ChartGenerator.CATEGORY_COLORS)
+        fig.update_layout(height=400)
+        return fig
+    
+    @staticmethod
+    @cached_figure
+    def create_achievement_chart(achievements_df):
+        """Create achievement impact chart"""
+        fig = px.bar(achievements_df, x='Category', y='Impact', 
+                     color='Category', title="Achievement Impact Analysis (%)",
+                     color_discrete_sequence=ChartGenerator.CATEGORY_COLORS)
+        fig.update_layout(height=400)
+        return fig
 
 class PredictionEngine:
     """Class for crime prediction functionality"""
     
+    # Seasonal adjustment per month; index 0 is the neutral factor for months outside 1-12
+    SEASONAL_FACTORS = np.array([1.0, 1.1, 0.9, 1.0, 1.05, 1.1, 1.15, 1.2, 1.1, 1.05, 1.0, 0.95, 0.9], dtype=np.float32)
+    
     def __init__(self, df):
         self.df = df
-        self.crime_types = [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
+        self.crime_types = list(get_crime_columns(df))
+        self._rng = np.random.default_rng()
+        self._unit_values = self._split_by_unit(df, self.crime_types)
+        self._tensor = None
+    
+    @staticmethod
+    def _split_by_unit(df, crime_types):
+        """Split the crime matrix into one date-ordered float32 block per unit"""
+        codes, units = pd.factorize(df['Unit'])
+        dates = df['Date'].to_numpy()
+        
+        # The loaders already order rows by (Unit, Date), so only an unsorted frame pays for a sort
+        if pd.MultiIndex.from_arrays([codes, dates]).is_monotonic_increasing:
+            order = slice(None)
+        else:
+            order = np.lexsort((dates, codes))
+        
+        # Row slices of a C-contiguous matrix stay C-contiguous
+        values = df[crime_types].to_numpy(dtype=np.float32)[order]
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        return dict(zip(units, np.split(values, boundaries)))
+    
+    def _prediction_tensor(self):
+        """Build the noise-free (unit, month, crime) prediction tensor on first use"""
+        if self._tensor is None:
+            units = list(self._unit_values)
+            recent_values = [values[-12:] for values in self._unit_values.values()]
+            
+            # Calculate historical averages and recent totals, one row per unit; means accumulate in float64
+            historical_avg = np.stack([values.mean(axis=0, dtype=np.float64) for values in self._unit_values.values()])
+            recent_totals = np.stack([recent.sum(axis=0) for recent in recent_values])
+            
+            # Calculate trend factors
+            trend = np.stack([(recent[-1] - recent[0]) / len(recent) for recent in recent_values])
+            trend_factors = np.where(recent_totals > 0, 1 + (trend * 0.1), 1.0)
+            
+            expected = historical_avg[:, None, :] * self.SEASONAL_FACTORS[None, :, None] * trend_factors[:, None, :]
+            self._tensor = dict(zip(units, range(len(units)))), expected, historical_avg, recent_totals
+        return self._tensor
     
     def generate_predictions(self, prediction_year, prediction_month, prediction_unit):
         """Generate crime predictions for specified parameters"""
-        unit_data = self.df[self.df['Unit'] == prediction_unit]
+        unit_index, expected, historical_avg, recent_totals = self._prediction_tensor()
+        unit = unit_index.get(prediction_unit)
         
-        if len(unit_data) == 0:
+        if unit is None:
             return None, None, None
         
-        # Calculate historical averages
-        historical_avg = unit_data[self.crime_types].mean()
-        
-        # Seasonal adjustment factors
-        seasonal_factors = {
-            1: 1.1, 2: 0.9, 3: 1.0, 4: 1.05, 5: 1.1, 6: 1.15,
-            7: 1.2, 8: 1.1, 9: 1.05, 10: 1.0, 11: 0.95, 12: 0.9
-        }
-        
-        # Calculate trend factors
-        recent_data = unit_data.tail(12)
-        trend_factors = {}
-        for crime in self.crime_types:
-            if recent_data[crime].sum() > 0:
-                trend = (recent_data[crime].iloc[-1] - recent_data[crime].iloc[0]) / len(recent_data)
-                trend_factors[crime] = 1 + (trend * 0.1)
-            else:
-                trend_factors[crime] = 1.0
-        
         # Generate predictions
-        predictions = {}
-        for crime in self.crime_types:
-            base_prediction = historical_avg[crime]
-            seasonal_adj = seasonal_factors.get(prediction_month, 1.0)
-            trend_adj = trend_factors.get(crime, 1.0)
-            random_factor = np.random.uniform(0.85, 1.15)
-            
-            predictions[crime] = base_prediction * seasonal_adj * trend_adj * random_factor
+        month = prediction_month if 1 <= prediction_month <= 12 else 0
+        random_factors = self._rng.uniform(0.85, 1.15, size=len(self.crime_types))
+        predictions = expected[unit, month] * random_factors
         
         # Get top 5 predictions
-        top_5_crimes = pd.Series(predictions).nlargest(5)
+        crime_index = pd.Index(self.crime_types)
+        top_5_crimes = self._top_k(predictions, crime_index)
+        recent_top_5 = self._top_k(recent_totals[unit], crime_index)
         
-        return top_5_crimes, historical_avg, recent_data[self.crime_types].sum().sort_values(ascending=False).head(5)
+        return top_5_crimes, pd.Series(historical_avg[unit], index=crime_index), recent_top_5
+    
+    @staticmethod
+    def _top_k(values, labels, k=5):
+        """Return the k largest values as a descending Series, selected in O(n) with np.argpartition"""
+        k = min(k, len(values))
+        top_idx = np.argpartition(-values, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-values[top_idx], kind='stable')]
+        return pd.Series(values[top_idx], index=labels[top_idx])
+
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def get_prediction_engine(df):
+    """Return a PredictionEngine for df, built once and shared across reruns"""
+    return PredictionEngine(df)
 
 class PreventionStrategies:
     """Class for prevention strategies and recommendations"""
     
-    def __init__(self):
-        self.strategies = {
-            'Narcotics': {
-                'immediate': ['Deploy undercover units', 'Border control', 'Drug awareness campaigns'],
-                'short_term': ['School prevention programs', 'Treatment centers', 'Community outreach'],
-                'long_term': ['Policy reform', 'International cooperation', 'Research programs']
-            },
-            'Woman & Child Repression': {
-                'immediate': ['24/7 helpline', 'Emergency response teams', 'Safe shelters'],
-                'short_term': ['Legal aid services', 'Counseling programs', 'Education campaigns'],
-                'long_term': ['Policy changes', 'Social awareness', 'Economic empowerment']
-            },
-            'Theft': {
-                'immediate': ['Increase patrols', 'Surveillance cameras', 'Community alerts'],
-                'short_term': ['Security training', 'Neighborhood watch', 'Technology upgrades'],
-                'long_term': ['Urban planning', 'Economic development', 'Social programs']
-            },
-            'Burglary': {
-                'immediate': ['Security assessments', 'Alarm systems', 'Patrol routes'],
-                'short_term': ['Home security programs', 'Community education', 'Technology integration'],
-                'long_term': ['Building codes', 'Urban design', 'Economic opportunities']
-            },
-            'Murder': {
-                'immediate': ['Emergency response', 'Witness protection', 'Crime scene analysis'],
-                'short_term': ['Gang intervention', 'Mental health services', 'Conflict resolution'],
-                'long_term': ['Social programs', 'Education reform', 'Economic development']
-            }
+    # Static content lives on the class, so every page instance shares one copy
+    STRATEGIES = {
+        'Narcotics': {
+            'immediate': ['Deploy undercover units', 'Border control', 'Drug awareness campaigns'],
+            'short_term': ['School prevention programs', 'Treatment centers', 'Community outreach'],
+            'long_term': ['Policy reform', 'International cooperation', 'Research programs']
+        },
+        'Woman & Child Repression': {
+            'immediate': ['24/7 helpline', 'Emergency response teams', 'Safe shelters'],
+            'short_term': ['Legal aid services', 'Counseling programs', 'Education campaigns'],
+            'long_term': ['Policy changes', 'Social awareness', 'Economic empowerment']
+        },
+        'Theft': {
+            'immediate': ['Increase patrols', 'Surveillance cameras', 'Community alerts'],
+            'short_term': ['Security training', 'Neighborhood watch', 'Technology upgrades'],
+            'long_term': ['Urban planning', 'Economic development', 'Social programs']
+        },
+        'Burglary': {
+            'immediate': ['Security assessments', 'Alarm systems', 'Patrol routes'],
+            'short_term': ['Home security programs', 'Community education', 'Technology integration'],
+            'long_term': ['Building codes', 'Urban design', 'Economic opportunities']
+        },
+        'Murder': {
+            'immediate': ['Emergency response', 'Witness protection', 'Crime scene analysis'],
+            'short_term': ['Gang intervention', 'Mental health services', 'Conflict resolution'],
+            'long_term': ['Social programs', 'Education reform', 'Economic development']
         }
+    }
+    
+    SUCCESS_METRICS = {
+        'Metric': ['Crime Reduction', 'Response Time', 'Community Reporting', 'Repeat Offenses', 'Case Resolution'],
+        'Target': ['20% within 6 months', '50% improvement', '30% increase', '25% reduction', '40% improvement'],
+        'Timeline': ['6 months', '3 months', '12 months', '9 months', '6 months']
+    }
+    
+    def __init__(self):
+        self.strategies = self.STRATEGIES
     
     def get_strategy(self, crime_type):
         """Get prevention strategy for specific crime type"""
@@ -292,82 +523,110 @@ class PreventionStrategies:
     
     def get_success_metrics(self):
         """Get success metrics for prevention strategies"""
-        return {
-            'Metric': ['Crime Reduction', 'Response Time', 'Community Reporting', 'Repeat Offenses', 'Case Resolution'],
-            'Target': ['20% within 6 months', '50% improvement', '30% increase', '25% reduction', '40% improvement'],
-            'Timeline': ['6 months', '3 months', '12 months', '9 months', '6 months']
-        }
+        return self.SUCCESS_METRICS
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_success_frame(cls):
+        """Get success metrics as a DataFrame, built once"""
+        return pd.DataFrame(cls.SUCCESS_METRICS)
 
 class AlgorithmMetrics:
     """Class for algorithm performance metrics and data"""
     
-    def __init__(self):
-        self.algorithms = {
-            "Machine Learning Classification": {
-                "algorithm": "Random Forest Classifier",
-                "accuracy": "85%",
-                "purpose": "Automatically recommend prevention strategies",
-                "benefit": "Reduces manual analysis time by 80%",
-                "gradient": "#667eea 0%, #764ba2 100%"
-            },
-            "Resource Optimization": {
-                "algorithm": "Sequential Least Squares Programming",
-                "accuracy": "100%",
-                "purpose": "Maximize crime reduction with limited resources",
-                "benefit": "Improves resource efficiency by 40%",
-                "gradient": "#f093fb 0%, #f5576c 100%"
-            },
-            "Network Analysis": {
-                "algorithm": "Network Analysis with Community Detection",
-                "accuracy": "0.45",
-                "purpose": "Identify crime relationships and communities",
-                "benefit": "Improves coordinated prevention by 35%",
-                "gradient": "#4facfe 0%, #00f2fe 100%"
-            },
-            "Predictive Analytics": {
-                "algorithm": "Gradient Boosting Regressor",
-                "accuracy": "87%",
-                "purpose": "Predict future crime trends",
-                "benefit": "Improves planning accuracy by 45%",
-                "gradient": "#43e97b 0%, #38f9d7 100%"
-            },
-            "Pattern Clustering": {
-                "algorithm": "K-Means Clustering",
-                "accuracy": "4 clusters",
-                "purpose": "Identify distinct crime patterns",
-                "benefit": "Improves targeting efficiency by 50%",
-                "gradient": "#fa709a 0%, #fee140 100%"
-            }
+    ALGORITHMS = {
+        "Machine Learning Classification": {
+            "algorithm": "Random Forest Classifier",
+            "accuracy": "85%",
+            "purpose": "Automatically recommend prevention strategies",
+            "benefit": "Reduces manual analysis time by 80%",
+            "gradient": "#667eea 0%, #764ba2 100%"
+        },
+        "Resource Optimization": {
+            "algorithm": "Sequential Least Squares Programming",
+            "accuracy": "100%",
+            "purpose": "Maximize crime reduction with limited resources",
+            "benefit": "Improves resource efficiency by 40%",
+            "gradient": "#f093fb 0%, #f5576c 100%"
+        },
+        "Network Analysis": {
+            "algorithm": "Network Analysis with Community Detection",
+            "accuracy": "0.45",
+            "purpose": "Identify crime relationships and communities",
+            "benefit": "Improves coordinated prevention by 35%",
+            "gradient": "#4facfe 0%, #00f2fe 100%"
+        },
+        "Predictive Analytics": {
+            "algorithm": "Gradient Boosting Regressor",
+            "accuracy": "87%",
+            "purpose": "Predict future crime trends",
+            "benefit": "Improves planning accuracy by 45%",
+            "gradient": "#43e97b 0%, #38f9d7 100%"
+        },
+        "Pattern Clustering": {
+            "algorithm": "K-Means Clustering",
+            "accuracy": "4 clusters",
+            "purpose": "Identify distinct crime patterns",
+            "benefit": "Improves targeting efficiency by 50%",
+            "gradient": "#fa709a 0%, #fee140 100%"
         }
+    }
+    
+    PERFORMANCE_METRICS = {
+        'Algorithm': ['ML Classification', 'Resource Optimization', 'Network Analysis', 'Predictive Analytics', 'Pattern Clustering'],
+        'Accuracy/Score': [85, 100, 0.45, 87, 4],
+        'Metric Type': ['Accuracy %', 'Success %', 'Density', 'Accuracy %', 'Clusters'],
+        'Improvement': [80, 40, 35, 45, 50],
+        'Improvement Type': ['Time Reduction %', 'Efficiency %', 'Coordination %', 'Planning %', 'Targeting %']
+    }
+    
+    ACHIEVEMENTS = {
+        'Achievement': [
+            'Reduced manual analysis time by 80%',
+            'Improved strategy recommendation accuracy by 60%',
+            'Enhanced resource allocation efficiency by 40%',
+            'Increased prediction accuracy by 45%',
+            'Improved targeting efficiency by 50%'
+        ],
+        'Impact': [80, 60, 40, 45, 50],
+        'Category': ['Time', 'Accuracy', 'Efficiency', 'Prediction', 'Targeting']
+    }
+    
+    TIMELINE = {
+        'Phase': ['Phase 1: Data Analysis', 'Phase 2: Algorithm Development', 'Phase 3: Testing & Validation', 'Phase 4: Deployment', 'Phase 5: Monitoring'],
+        'Duration': ['2 weeks', '4 weeks', '2 weeks', '1 week', 'Ongoing'],
+        'Deliverables': ['Data insights', 'ML models', 'Validation reports', 'Live system', 'Performance metrics']
+    }
+    
+    def __init__(self):
+        self.algorithms = self.ALGORITHMS
     
     def get_performance_metrics(self):
         """Get performance metrics for all algorithms"""
-        return {
-            'Algorithm': ['ML Classification', 'Resource Optimization', 'Network Analysis', 'Predictive Analytics', 'Pattern Clustering'],
-            'Accuracy/Score': [85, 100, 0.45, 87, 4],
-            'Metric Type': ['Accuracy %', 'Success %', 'Density', 'Accuracy %', 'Clusters'],
-            'Improvement': [80, 40, 35, 45, 50],
-            'Improvement Type': ['Time Reduction %', 'Efficiency %', 'Coordination %', 'Planning %', 'Targeting %']
-        }
+        return self.PERFORMANCE_METRICS
     
     def get_achievements_data(self):
         """Get achievements data for visualization"""
-        return {
-            'Achievement': [
-                'Reduced manual analysis time by 80%',
-                'Improved strategy recommendation accuracy by 60%',
-                'Enhanced resource allocation efficiency by 40%',
-                'Increased prediction accuracy by 45%',
-                'Improved targeting efficiency by 50%'
-            ],
-            'Impact': [80, 60, 40, 45, 50],
-            'Category': ['Time', 'Accuracy', 'Efficiency', 'Prediction', 'Targeting']
-        }
+        return self.ACHIEVEMENTS
     
     def get_timeline_data(self):
         """Get implementation timeline data"""
-        return {
-            'Phase': ['Phase 1: Data Analysis', 'Phase 2: Algorithm Development', 'Phase 3: Testing & Validation', 'Phase 4: Deployment', 'Phase 5: Monitoring'],
-            'Duration': ['2 weeks', '4 weeks', '2 weeks', '1 week', 'Ongoing'],
-            'Deliverables': ['Data insights', 'ML models', 'Validation reports', 'Live system', 'Performance metrics']
-        }
+        return self.TIMELINE
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_performance_frame(cls):
+        """Get performance metrics as a DataFrame, built once"""
+        return pd.DataFrame(cls.PERFORMANCE_METRICS)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_achievements_frame(cls):
+        """Get achievements data as a DataFrame, built once"""
+        return pd.DataFrame(cls.ACHIEVEMENTS)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_timeline_frame(cls):
+        """Get implementation timeline as a DataFrame, built once"""
+        return pd.DataFrame(cls.TIMELINE)
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from dashboard_components import DashboardComponents
+from prepare_data import CSV_PATH, PARQUET_PATH, load_csv, parquet_is_current, row_major_crime_block
 from dashboard_pages import (
     OverviewPage, CrimeTrendsPage, GeographicPage, PredictionsPage, 
     InteractivePage, AdvancedAlgorithmsPage, PreventionStrategiesPage, 
@@ -14,7 +15,7 @@ class CrimeAnalysisDashboard:
         """Initialize the dashboard"""
         self.components = DashboardComponents()
         self.df = None
-        self.pages = {}
+        self.page_factories = {}
         self.setup_page_config()
         self.load_data()
         self.initialize_pages()
@@ -28,22 +29,24 @@ class CrimeAnalysisDashboard:
             initial_sidebar_state="expanded"
         )
         
-        # Apply custom CSS
+        # Apply custom CSS; the stylesheet is read once, but must be emitted on every
+        # run since elements not re-rendered are dropped from the page
         st.markdown(self.components.get_css_styles(), unsafe_allow_html=True)
         
         # Main header
         st.markdown('<h1 class="main-header">🚔 Crime Analysis & Prediction Dashboard</h1>', unsafe_allow_html=True)
     
     @staticmethod
-    @st.cache_data
+    @st.cache_resource
     def _load_data():
-        """Load and cache the crime data"""
+        """Load the crime data once and share it read-only across reruns"""
         try:
-            df = pd.read_csv('crime_data_processed.csv')
-            df['Date'] = pd.to_datetime(df['Date'])
-            df['Year'] = df['Date'].dt.year
-            df['Month'] = df['Date'].dt.month
-            return df
+            # Prefer the typed Parquet file written by prepare_data.py, unless the CSV has changed since
+            if parquet_is_current(PARQUET_PATH, CSV_PATH):
+                df = pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+            else:
+                df = load_csv(CSV_PATH)
+            return row_major_crime_block(df)
         except Exception as e:
             st.error(f"Error loading data: {e}")
             return None
@@ -57,63 +60,44 @@ class CrimeAnalysisDashboard:
             ## ⚠️ Data Not Found
             
             Please ensure 'crime_data_processed.csv' exists in the current directory.
+            Run `python prepare_data.py` to build the faster-loading Parquet copy.
             """)
             st.stop()
     
     def initialize_pages(self):
-        """Initialize all page objects"""
-        if self.df is not None:
-            self.pages = {
-                "🏠 Overview": OverviewPage(self.df),
-                "📈 Crime Trends": CrimeTrendsPage(self.df),
-                "🗺️ Geographic Analysis": GeographicPage(self.df),
-                "🔮 Crime Predictions": PredictionsPage(self.df),
-                "📊 Interactive Visualizations": InteractivePage(self.df),
-                "🤖 Advanced Algorithms": AdvancedAlgorithmsPage(),
-                "🛡️ Prevention Strategies": PreventionStrategiesPage(self.df),
-                "🎯 Benefits & Achievements": BenefitsAchievementsPage()
-            }
+        """Register page factories; each page is built on first visit and reused for the session"""
+        if self.df is None:
+            return
+        
+        self.page_factories = {
+            "🏠 Overview": lambda: OverviewPage(self.df),
+            "📈 Crime Trends": lambda: CrimeTrendsPage(self.df),
+            "🗺️ Geographic Analysis": lambda: GeographicPage(self.df),
+            "🔮 Crime Predictions": lambda: PredictionsPage(self.df),
+            "📊 Interactive Visualizations": lambda: InteractivePage(self.df),
+            "🤖 Advanced Algorithms": AdvancedAlgorithmsPage,
+            "🛡️ Prevention Strategies": lambda: PreventionStrategiesPage(self.df),
+            "🎯 Benefits & Achievements": BenefitsAchievementsPage
+        }
+        
+        # Drop pages built for a previously loaded DataFrame
+        if st.session_state.get('pages_df_id') != id(self.df):
+            st.session_state.page_cache = {}
+            st.session_state.pages_df_id = id(self.df)
+    
+    def get_page(self, page_name):
+        """Return the page object for page_name, building it on first use in this session"""
+        page_cache = st.session_state.page_cache
+        if page_name not in page_cache:
+            page_cache[page_name] = self.page_factories[page_name]()
+        return page_cache[page_name]
     
     def create_sidebar(self):
         """Create the sidebar navigation"""
         st.sidebar.markdown("## 📊 Dashboard Navigation")
         
-        # Create navigation buttons
-        col1, col2 = st.sidebar.columns(2)
-        
-        with col1:
-            if st.button("🏠 Overview", use_container_width=True):
-                st.session_state.page = "🏠 Overview"
-            
-            if st.button("📈 Crime Trends", use_container_width=True):
-                st.session_state.page = "📈 Crime Trends"
-            
-            if st.button("🗺️ Geographic", use_container_width=True):
-                st.session_state.page = "🗺️ Geographic Analysis"
-        
-        with col2:
-            if st.button("🔮 Predictions", use_container_width=True):
-                st.session_state.page = "🔮 Crime Predictions"
-            
-            if st.button("📊 Interactive", use_container_width=True):
-                st.session_state.page = "📊 Interactive Visualizations"
-        
-        # Advanced Algorithms Section
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("## 🤖 Advanced Algorithms")
-        
-        col3, col4 = st.sidebar.columns(2)
-        
-        with col3:
-            if st.button("🤖 ML Algorithms", use_container_width=True):
-                st.session_state.page = "🤖 Advanced Algorithms"
-            
-            if st.button("🎯 Prevention", use_container_width=True):
-                st.session_state.page = "🛡️ Prevention Strategies"
-        
-        with col4:
-            if st.button("📊 Benefits", use_container_width=True):
-                st.session_state.page = "🎯 Benefits & Achievements"
+        # One radio widget bound to session_state.page selects the page to render
+        st.sidebar.radio("Go to", list(self.page_factories.keys()), key='page')
     
     def get_current_page(self):
         """Get the current page from session state"""
@@ -125,9 +109,9 @@ class CrimeAnalysisDashboard:
         """Render the current page"""
         current_page = self.get_current_page()
         
-        if current_page in self.pages:
+        if current_page in self.page_factories:
             try:
-                self.pages[current_page].render()
+                self.get_page(current_page).render()
             except Exception as e:
                 st.error(f"Error rendering {current_page}: {e}")
                 st.info("Please try refreshing the page or contact support.")
@@ -138,7 +122,7 @@ class CrimeAnalysisDashboard:
         """Render the dashboard footer"""
         st.markdown("---")
         st.markdown("""
-        <div style='text-align: center; color: #666;'>
+        <div class="footer">
             <p>🚔 Crime Analysis Dashboard | Built with Streamlit | Data Science Project</p>
         </div>
         """, unsafe_allow_html=True)
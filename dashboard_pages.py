@@ -1,16 +1,17 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from dashboard_components import DashboardComponents, DataProcessor, ChartGenerator, PredictionEngine, PreventionStrategies, AlgorithmMetrics
+import numpy as np
+from dashboard_components import DashboardComponents, get_crime_columns, get_data_processor, ChartGenerator, get_prediction_engine, PreventionStrategies, AlgorithmMetrics
 
 class OverviewPage:
     """Class for Overview page functionality"""
     
     def __init__(self, df):
         self.df = df
+        self.crime_cols = get_crime_columns(df)
+        self.numeric_cols = df.select_dtypes(include=[np.number]).columns
         self.components = DashboardComponents()
-        self.data_processor = DataProcessor(df)
+        self.data_processor = get_data_processor(df)
         self.chart_generator = ChartGenerator()
     
     def render(self):
@@ -21,18 +22,17 @@ class OverviewPage:
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.markdown(self.components.create_metric_card("Total Records", f"{len(self.df):,}"))
+            st.markdown(self.components.create_metric_card("Total Records", f"{len(self.df):,}"), unsafe_allow_html=True)
         
         with col2:
             date_range = f"{self.df['Date'].min().strftime('%Y-%m')} - {self.df['Date'].max().strftime('%Y-%m')}"
-            st.markdown(self.components.create_metric_card("Date Range", date_range))
+            st.markdown(self.components.create_metric_card("Date Range", date_range), unsafe_allow_html=True)
         
         with col3:
-            st.markdown(self.components.create_metric_card("Police Units", str(self.df['Unit'].nunique())))
+            st.markdown(self.components.create_metric_card("Police Units", str(self.df['Unit'].nunique())), unsafe_allow_html=True)
         
         with col4:
-            crime_types = len([col for col in self.df.columns if col not in ['Date', 'Unit', 'Year', 'Month']])
-            st.markdown(self.components.create_metric_card("Crime Types", str(crime_types)))
+            st.markdown(self.components.create_metric_card("Crime Types", str(len(self.crime_cols))), unsafe_allow_html=True)
         
         # Data preview
         st.markdown("### 📋 Data Preview")
@@ -40,8 +40,7 @@ class OverviewPage:
         
         # Summary statistics
         st.markdown("### 📈 Summary Statistics")
-        numeric_cols = self.df.select_dtypes(include=[pd.np.number]).columns
-        st.dataframe(self.df[numeric_cols].describe(), use_container_width=True)
+        st.dataframe(self.df[self.numeric_cols].describe(), use_container_width=True)
         
         # Crime distribution
         st.markdown("## 📈 Crime Distribution")
@@ -54,23 +53,28 @@ class CrimeTrendsPage:
     
     def __init__(self, df):
         self.df = df
-        self.data_processor = DataProcessor(df)
+        self.crime_cols = get_crime_columns(df)
+        self.data_processor = get_data_processor(df)
         self.chart_generator = ChartGenerator()
     
     def render(self):
         """Render the Crime Trends page"""
         st.markdown("## 📈 Crime Trends Analysis")
         
+        self._render_trends()
+    
+    @st.fragment
+    def _render_trends(self):
+        """Render the year and crime selectors with their trend charts"""
         # Time period selector
+        years = self.data_processor.get_years()
         col1, col2 = st.columns(2)
         with col1:
-            start_year = st.selectbox("Start Year", sorted(self.df['Year'].unique()))
+            start_year = st.selectbox("Start Year", years)
         with col2:
-            end_year = st.selectbox("End Year", sorted(self.df['Year'].unique()), index=len(sorted(self.df['Year'].unique()))-1)
+            end_year = st.selectbox("End Year", years, index=len(years)-1)
         
-        # Get crime columns
-        crime_cols = [col for col in self.df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
-        selected_crime = st.selectbox("Select Crime Type", crime_cols)
+        selected_crime = st.selectbox("Select Crime Type", self.crime_cols)
         
         # Monthly trends
         st.markdown("### 📅 Monthly Crime Trends")
@@ -80,8 +84,7 @@ class CrimeTrendsPage:
         
         # Year-over-year comparison
         st.markdown("### 📊 Year-over-Year Comparison")
-        filtered_df = self.df[(self.df['Year'] >= start_year) & (self.df['Year'] <= end_year)]
-        yearly_data = filtered_df.groupby('Year')[crime_cols].sum()
+        yearly_data = self.data_processor.get_yearly_data(start_year, end_year)
         fig = self.chart_generator.create_yearly_comparison_chart(yearly_data)
         st.plotly_chart(fig, use_container_width=True)
 
@@ -90,18 +93,23 @@ class GeographicPage:
     
     def __init__(self, df):
         self.df = df
-        self.data_processor = DataProcessor(df)
+        self.crime_cols = get_crime_columns(df)
+        self.data_processor = get_data_processor(df)
         self.chart_generator = ChartGenerator()
     
     def render(self):
         """Render the Geographic Analysis page"""
         st.markdown("## 🗺️ Geographic Crime Analysis")
         
+        self._render_unit_analysis()
+    
+    @st.fragment
+    def _render_unit_analysis(self):
+        """Render the crime selector with the unit bar chart and heatmap"""
         # Unit-wise analysis
         st.markdown("### 🏢 Crime by Police Unit")
         
-        crime_cols = [col for col in self.df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
-        selected_crime_geo = st.selectbox("Select Crime Type for Geographic Analysis", crime_cols)
+        selected_crime_geo = st.selectbox("Select Crime Type for Geographic Analysis", self.crime_cols)
         
         unit_data = self.data_processor.get_unit_data(selected_crime_geo)
         fig = self.chart_generator.create_unit_analysis_chart(unit_data, selected_crime_geo)
@@ -109,7 +117,7 @@ class GeographicPage:
         
         # Heatmap
         st.markdown("### 🔥 Crime Heatmap by Unit and Year")
-        heatmap_data = self.df.groupby(['Unit', 'Year'])[selected_crime_geo].sum().unstack(fill_value=0)
+        heatmap_data = self.data_processor.get_unit_year_data(selected_crime_geo)
         fig = self.chart_generator.create_heatmap_chart(heatmap_data, selected_crime_geo)
         st.plotly_chart(fig, use_container_width=True)
 
@@ -118,13 +126,19 @@ class PredictionsPage:
     
     def __init__(self, df):
         self.df = df
-        self.prediction_engine = PredictionEngine(df)
+        self.prediction_engine = get_prediction_engine(df)
         self.chart_generator = ChartGenerator()
+        self.rng = np.random.default_rng()
     
     def render(self):
         """Render the Crime Predictions page"""
         st.markdown("## 🔮 Crime Prediction System")
         
+        self._render_predictions()
+    
+    @st.fragment
+    def _render_predictions(self):
+        """Render the prediction controls and results"""
         # Prediction controls
         col1, col2, col3 = st.columns(3)
         
@@ -152,33 +166,29 @@ class PredictionsPage:
                 
                 with col1:
                     # Bar chart
-                    fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
-                                title=f'Top 5 Crime Predictions for {prediction_unit} - {pd.Timestamp(2020, prediction_month, 1).strftime("%B")} {prediction_year}',
-                                labels={'x': 'Crime Type', 'y': 'Predicted Cases'})
-                    fig.update_layout(height=400)
+                    fig = self.chart_generator.create_prediction_chart(top_5_crimes, prediction_unit, prediction_month, prediction_year)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 with col2:
                     # Pie chart
-                    fig = px.pie(values=top_5_crimes.values, names=top_5_crimes.index,
-                                title="Prediction Distribution")
-                    fig.update_layout(height=400)
+                    fig = self.chart_generator.create_prediction_distribution_chart(top_5_crimes)
                     st.plotly_chart(fig, use_container_width=True)
                 
                 # Prediction table
                 st.markdown("### 📋 Detailed Predictions")
+                crime_types = top_5_crimes.index.to_numpy()
+                confidence = self.rng.uniform(0.75, 0.95, size=len(crime_types))
                 prediction_df = pd.DataFrame({
-                    'Crime Type': top_5_crimes.index,
-                    'Predicted Cases': top_5_crimes.values.round(1),
-                    'Historical Average': [historical_avg[crime].round(1) for crime in top_5_crimes.index],
-                    'Confidence Level': [f"{pd.np.random.uniform(0.75, 0.95):.1%}" for _ in range(len(top_5_crimes))]
-                })
+                    'Crime Type': crime_types,
+                    'Predicted Cases': top_5_crimes.to_numpy().round(1),
+                    'Historical Average': historical_avg.reindex(crime_types).to_numpy().round(1),
+                    'Confidence Level': [f"{level:.1%}" for level in confidence]
+                }, copy=False)
                 st.dataframe(prediction_df, use_container_width=True)
                 
                 # Show historical trend
                 st.markdown("### 📈 Historical Trend Analysis")
-                fig = px.bar(x=recent_trend.index, y=recent_trend.values,
-                            title=f"Historical Crime Trends for {prediction_unit} (Last 24 Months)")
+                fig = self.chart_generator.create_recent_trend_chart(recent_trend, prediction_unit)
                 st.plotly_chart(fig, use_container_width=True)
                 
             else:
@@ -189,19 +199,24 @@ class InteractivePage:
     
     def __init__(self, df):
         self.df = df
-        self.data_processor = DataProcessor(df)
+        self.crime_cols = get_crime_columns(df)
+        self.data_processor = get_data_processor(df)
         self.chart_generator = ChartGenerator()
     
     def render(self):
         """Render the Interactive Visualizations page"""
         st.markdown("## 📊 Interactive Crime Visualizations")
         
+        self._render_comparisons()
+    
+    @st.fragment
+    def _render_comparisons(self):
+        """Render the crime multiselect with its comparison charts"""
         # Multi-select for crime types
-        crime_cols = [col for col in self.df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
         selected_crimes = st.multiselect(
             "Select Crime Types to Compare",
-            crime_cols,
-            default=crime_cols[:3]
+            self.crime_cols,
+            default=self.crime_cols[:3]
         )
         
         if selected_crimes:
@@ -219,7 +234,7 @@ class InteractivePage:
             
             # Unit comparison
             st.markdown("### 🏢 Unit-wise Comparison")
-            unit_comparison = self.df.groupby('Unit')[selected_crimes].sum()
+            unit_comparison = self.data_processor.get_unit_comparison(selected_crimes)
             fig = self.chart_generator.create_unit_comparison_chart(unit_comparison)
             st.plotly_chart(fig, use_container_width=True)
 
@@ -243,49 +258,44 @@ class AdvancedAlgorithmsPage:
         to provide data-driven crime prevention strategies with actionable insights.
         """)
         
-        # Algorithm cards with detailed information
+        # Algorithm cards with detailed information, one HTML block per column
+        algorithms = list(self.algorithm_metrics.algorithms.items())
         col1, col2 = st.columns(2)
         
-        with col1:
-            for i, (name, data) in enumerate(list(self.algorithm_metrics.algorithms.items())[:3]):
-                st.markdown(self.components.create_algorithm_card(
-                    name, data["algorithm"], data["accuracy"], 
-                    data["purpose"], data["benefit"], data["gradient"]
-                ))
-        
-        with col2:
-            for i, (name, data) in enumerate(list(self.algorithm_metrics.algorithms.items())[3:]):
-                st.markdown(self.components.create_algorithm_card(
-                    name, data["algorithm"], data["accuracy"], 
-                    data["purpose"], data["benefit"], data["gradient"]
-                ))
+        for column, column_algorithms in ((col1, algorithms[:3]), (col2, algorithms[3:])):
+            with column:
+                st.markdown("".join(
+                    self.components.create_algorithm_card(
+                        name, data["algorithm"], data["accuracy"], 
+                        data["purpose"], data["benefit"], data["gradient"]
+                    )
+                    for name, data in column_algorithms
+                ), unsafe_allow_html=True)
         
         # Algorithm performance metrics
         st.markdown("## 📊 Algorithm Performance Metrics")
         
         metrics_data = self.algorithm_metrics.get_performance_metrics()
-        metrics_df = pd.DataFrame(metrics_data)
+        metrics_df = self.algorithm_metrics.get_performance_frame()
         
         # Display metrics in a nice format
+        acc, imp = metrics_data['Accuracy/Score'], metrics_data['Improvement']
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            st.metric("ML Classification", f"{metrics_data['Accuracy/Score'][0]}%", f"{metrics_data['Improvement'][0]}% improvement")
+            st.metric("ML Classification", f"{acc[0]}%", f"{imp[0]}% improvement")
         with col2:
-            st.metric("Optimization", f"{metrics_data['Accuracy/Score'][1]}%", f"{metrics_data['Improvement'][1]}% efficiency")
+            st.metric("Optimization", f"{acc[1]}%", f"{imp[1]}% efficiency")
         with col3:
-            st.metric("Network Analysis", f"{metrics_data['Accuracy/Score'][2]}", f"{metrics_data['Improvement'][2]}% coordination")
+            st.metric("Network Analysis", f"{acc[2]}", f"{imp[2]}% coordination")
         with col4:
-            st.metric("Predictive Analytics", f"{metrics_data['Accuracy/Score'][3]}%", f"{metrics_data['Improvement'][3]}% planning")
+            st.metric("Predictive Analytics", f"{acc[3]}%", f"{imp[3]}% planning")
         with col5:
-            st.metric("Pattern Clustering", f"{metrics_data['Accuracy/Score'][4]}", f"{metrics_data['Improvement'][4]}% targeting")
+            st.metric("Pattern Clustering", f"{acc[4]}", f"{imp[4]}% targeting")
         
         # Algorithm comparison chart
         st.markdown("### 📈 Algorithm Performance Comparison")
-        fig = px.bar(metrics_df, x='Algorithm', y='Accuracy/Score', 
-                     color='Algorithm', title="Algorithm Performance Comparison",
-                     color_discrete_sequence=['#667eea', '#f093fb', '#4facfe', '#43e97b', '#fa709a'])
-        fig.update_layout(height=400)
+        fig = self.chart_generator.create_algorithm_comparison_chart(metrics_df)
         st.plotly_chart(fig, use_container_width=True)
 
 class PreventionStrategiesPage:
@@ -293,7 +303,7 @@ class PreventionStrategiesPage:
     
     def __init__(self, df):
         self.df = df
-        self.data_processor = DataProcessor(df)
+        self.data_processor = get_data_processor(df)
         self.chart_generator = ChartGenerator()
         self.prevention_strategies = PreventionStrategies()
         self.components = DashboardComponents()
@@ -313,26 +323,40 @@ class PreventionStrategiesPage:
         with col1:
             # Top 5 crimes chart
             top_5_crimes = total_crimes.head(5)
-            fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
-                         title="Top 5 Crime Types by Volume",
-                         color=top_5_crimes.values,
-                         color_continuous_scale='viridis')
-            fig.update_layout(height=400)
+            fig = self.chart_generator.create_top_crimes_chart(top_5_crimes)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Crime percentages
             crime_percentages = (top_5_crimes / top_5_crimes.sum() * 100).round(1)
-            fig = px.pie(values=crime_percentages.values, names=crime_percentages.index,
-                         title="Crime Distribution (%)")
-            fig.update_layout(height=400)
+            fig = self.chart_generator.create_crime_share_chart(crime_percentages)
             st.plotly_chart(fig, use_container_width=True)
         
         # Prevention strategies
         st.markdown("### 🛡️ Targeted Prevention Strategies")
         
+        self._render_strategy(top_5_crimes.index)
+        
+        # Resource allocation
+        st.markdown("### 💰 Resource Allocation Plan")
+        
+        # Calculate resource allocation based on crime percentages
+        resource_allocation = crime_percentages.head(5).copy()
+        
+        fig = self.chart_generator.create_resource_allocation_chart(resource_allocation)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Success metrics
+        st.markdown("### 📊 Expected Success Metrics")
+        
+        success_df = self.prevention_strategies.get_success_frame()
+        st.dataframe(success_df, use_container_width=True)
+    
+    @st.fragment
+    def _render_strategy(self, crime_types):
+        """Render the strategy selector and action cards for the chosen crime type"""
         # Display strategies for selected crime type
-        selected_crime = st.selectbox("Select Crime Type for Prevention Strategy", top_5_crimes.index)
+        selected_crime = st.selectbox("Select Crime Type for Prevention Strategy", crime_types)
         
         strategy = self.prevention_strategies.get_strategy(selected_crime)
         if strategy:
@@ -343,41 +367,21 @@ class PreventionStrategiesPage:
                     "🚨 Immediate Actions (0-30 days)", 
                     strategy['immediate'], 
                     "#ff6b6b 0%, #ee5a24 100%"
-                ))
+                ), unsafe_allow_html=True)
             
             with col2:
                 st.markdown(self.components.create_action_card(
                     "📅 Short-term Actions (1-6 months)", 
                     strategy['short_term'], 
                     "#feca57 0%, #ff9ff3 100%"
-                ))
+                ), unsafe_allow_html=True)
             
             with col3:
                 st.markdown(self.components.create_action_card(
                     "🎯 Long-term Actions (6-12 months)", 
                     strategy['long_term'], 
                     "#48dbfb 0%, #0abde3 100%"
-                ))
-        
-        # Resource allocation
-        st.markdown("### 💰 Resource Allocation Plan")
-        
-        # Calculate resource allocation based on crime percentages
-        resource_allocation = crime_percentages.head(5).copy()
-        
-        fig = px.bar(x=resource_allocation.index, y=resource_allocation.values,
-                     title="Recommended Resource Allocation (%)",
-                     color=resource_allocation.values,
-                     color_continuous_scale='plasma')
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Success metrics
-        st.markdown("### 📊 Expected Success Metrics")
-        
-        success_metrics = self.prevention_strategies.get_success_metrics()
-        success_df = pd.DataFrame(success_metrics)
-        st.dataframe(success_df, use_container_width=True)
+                ), unsafe_allow_html=True)
 
 class BenefitsAchievementsPage:
     """Class for Benefits & Achievements page functionality"""
@@ -411,16 +415,12 @@ class BenefitsAchievementsPage:
                 <h3>🎯 Benefit 1: Data-Driven Decisions</h3>
                 <p>85% accuracy in automated decision making with machine learning algorithms</p>
             </div>
-            """, unsafe_allow_html=True)
             
-            st.markdown("""
             <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 1.5rem; border-radius: 15px; color: white; margin: 1rem 0;">
                 <h3>🎯 Benefit 2: Resource Optimization</h3>
                 <p>40% improvement in resource allocation efficiency with mathematical optimization</p>
             </div>
-            """, unsafe_allow_html=True)
             
-            st.markdown("""
             <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 1.5rem; border-radius: 15px; color: white; margin: 1rem 0;">
                 <h3>🎯 Benefit 3: Network Intelligence</h3>
                 <p>35% improvement in coordinated prevention through network analysis</p>
@@ -433,9 +433,7 @@ class BenefitsAchievementsPage:
                 <h3>🎯 Benefit 4: Predictive Power</h3>
                 <p>87% prediction accuracy for proactive crime prevention planning</p>
             </div>
-            """, unsafe_allow_html=True)
             
-            st.markdown("""
             <div style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); padding: 1.5rem; border-radius: 15px; color: white; margin: 1rem 0;">
                 <h3>🎯 Benefit 5: Pattern Recognition</h3>
                 <p>50% improvement in targeting efficiency through pattern clustering</p>
@@ -445,14 +443,10 @@ class BenefitsAchievementsPage:
         # Achievements section
         st.markdown("## 🏆 **Key Achievements**")
         
-        achievements_data = self.algorithm_metrics.get_achievements_data()
-        achievements_df = pd.DataFrame(achievements_data)
+        achievements_df = self.algorithm_metrics.get_achievements_frame()
         
         # Achievement chart
-        fig = px.bar(achievements_df, x='Category', y='Impact', 
-                     color='Category', title="Achievement Impact Analysis (%)",
-                     color_discrete_sequence=['#667eea', '#f093fb', '#4facfe', '#43e97b', '#fa709a'])
-        fig.update_layout(height=400)
+        fig = self.chart_generator.create_achievement_chart(achievements_df)
         st.plotly_chart(fig, use_container_width=True)
         
         # Operational impact
@@ -474,6 +468,5 @@ class BenefitsAchievementsPage:
         # Implementation timeline
         st.markdown("### 📅 Implementation Timeline")
         
-        timeline_data = self.algorithm_metrics.get_timeline_data()
-        timeline_df = pd.DataFrame(timeline_data)
+        timeline_df = self.algorithm_metrics.get_timeline_frame()
         st.dataframe(timeline_df, use_container_width=True)
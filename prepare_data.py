@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+🚔 Crime Analysis Dashboard - Data Preparation
+==============================================
+
+Converts crime_data_processed.csv into a typed Parquet file so the dashboard
+can load it without CSV parsing or date conversion on a cold start.
+
+Usage:
+    python prepare_data.py
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+CSV_PATH = 'crime_data_processed.csv'
+PARQUET_PATH = 'crime_data_processed.parquet'
+
+META_COLUMNS = ['Date', 'Unit', 'Year', 'Month']
+
+def parquet_is_current(parquet_path=PARQUET_PATH, csv_path=CSV_PATH):
+    """True when the Parquet file exists and is at least as new as the CSV it was built from"""
+    if not os.path.exists(parquet_path):
+        return False
+    return not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+
+def load_csv(path=CSV_PATH):
+    """Read the processed CSV, derive Date/Year/Month and narrow the column dtypes"""
+    # Declare every dtype up front so the parser does a single typed pass
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {col: 'int32' for col in header.difference(META_COLUMNS, sort=False)}
+    dtypes['Unit'] = 'category'
+    
+    try:
+        df = pd.read_csv(path, dtype=dtypes, parse_dates=['Date'], engine='pyarrow')
+    except ImportError:
+        # pyarrow is optional for the CSV path; the default C parser reads the same schema
+        df = pd.read_csv(path, dtype=dtypes, parse_dates=['Date'])
+    df['Year'] = df['Date'].dt.year.astype('int16')
+    df['Month'] = df['Date'].dt.month.astype('int8')
+    df['Unit'] = df['Unit'].astype('category')
+    
+    # Crime counts are small non-negative integers
+    for col in df.columns.difference(META_COLUMNS, sort=False):
+        df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    
+    # Chronological rows within each unit, so a unit's last N positions are its last N months
+    return df.sort_values(['Unit', 'Date'], kind='stable', ignore_index=True)
+
+def row_major_crime_block(df):
+    """Store the crime counts as one row-major 2-D block so row slices read contiguous memory"""
+    crime_cols = df.columns.difference(META_COLUMNS, sort=False)
+    values = df[crime_cols].to_numpy(dtype=np.result_type(*df[crime_cols].dtypes))
+    
+    # A C-ordered (rows, crimes) array becomes a single pandas block without copying
+    crime_block = pd.DataFrame(np.ascontiguousarray(values), index=df.index, columns=crime_cols, copy=False)
+    return pd.concat([df.drop(columns=crime_cols), crime_block], axis=1)[df.columns]
+
+def main():
+    """Write the Parquet file read by the dashboard"""
+    df = load_csv()
+    df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd', index=False)
+    print(f"Wrote {len(df):,} rows to {PARQUET_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,11 @@ import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import os
 import warnings
+import zlib
+from chart_utils import MAX_HEATMAP_CELLS, MAX_LINE_POINTS, image_heatmap, lttb_indices
+from prepare_data import CSV_PATH, PARQUET_PATH, load_csv, parquet_is_current
 warnings.filterwarnings('ignore')
 
 # Page configuration
@@ -17,56 +21,17 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern design
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    .prediction-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #2c3e50 0%, #34495e 100%);
-    }
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.5rem 1rem;
-        font-weight: bold;
-        transition: all 0.3s ease;
-        margin: 0.2rem 0;
-    }
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    .stButton > button:active {
-        transform: translateY(0);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for modern design, shared with the modular dashboard
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')
+
+@st.cache_data(show_spinner=False)
+def read_css(path):
+    """Read the stylesheet from disk once per process"""
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+# Emitted on every run, since Streamlit drops any element a rerun does not re-send
+st.markdown(f"<style>\n{read_css(CSS_PATH)}</style>", unsafe_allow_html=True)
 
 # Title
 st.markdown('<h1 class="main-header">🚔 Crime Analysis & Prediction Dashboard</h1>', unsafe_allow_html=True)
@@ -74,62 +39,263 @@ st.markdown('<h1 class="main-header">🚔 Crime Analysis & Prediction Dashboard<
 # Sidebar
 st.sidebar.markdown("## 📊 Dashboard Navigation")
 
-# Create navigation buttons instead of dropdown
-col1, col2 = st.sidebar.columns(2)
+PAGES = [
+    "🏠 Overview",
+    "📈 Crime Trends",
+    "🗺️ Geographic Analysis",
+    "🔮 Crime Predictions",
+    "📊 Interactive Visualizations",
+    "🤖 Advanced Algorithms",
+    "🛡️ Prevention Strategies",
+    "🎯 Benefits & Achievements",
+]
 
-with col1:
-    if st.button("🏠 Overview", use_container_width=True):
-        st.session_state.page = "🏠 Overview"
-    
-    if st.button("📈 Crime Trends", use_container_width=True):
-        st.session_state.page = "📈 Crime Trends"
-    
-    if st.button("🗺️ Geographic", use_container_width=True):
-        st.session_state.page = "🗺️ Geographic Analysis"
+# One radio widget bound to session_state.page replaces the grid of buttons
+st.sidebar.radio("Go to", PAGES, key='page')
 
-with col2:
-    if st.button("🔮 Predictions", use_container_width=True):
-        st.session_state.page = "🔮 Crime Predictions"
-    
-    if st.button("📊 Interactive", use_container_width=True):
-        st.session_state.page = "📊 Interactive Visualizations"
+page = st.session_state.page
 
-# Advanced Algorithms Section
-st.sidebar.markdown("---")
-st.sidebar.markdown("## 🤖 Advanced Algorithms")
+META_COLUMNS = frozenset({'Date', 'Unit', 'Year', 'Month'})
 
-col3, col4 = st.sidebar.columns(2)
+@st.cache_data
+def get_crime_cols(columns):
+    """Return the crime count columns from a tuple of column names"""
+    return tuple(col for col in columns if col not in META_COLUMNS)
+
+# Cached aggregations, keyed by the page's selection; the shared DataFrame from load_data
+# never changes, so it is keyed by identity instead of hashing every row on each call
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def numeric_summary(df):
+    """Summary statistics of every numeric column"""
+    return df.select_dtypes(include=[np.number]).describe()
 
-with col3:
-    if st.button("🤖 ML Algorithms", use_container_width=True):
-        st.session_state.page = "🤖 Advanced Algorithms"
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def monthly_sum(df, crime, start_year, end_year):
+    """Sum one crime per (Year, Month) within a year range, dated to the first of each month"""
+    filtered_df = df[(df['Year'] >= start_year) & (df['Year'] <= end_year)]
+    monthly_data = filtered_df.groupby(['Year', 'Month'])[crime].sum().reset_index()
     
-    if st.button("🎯 Prevention", use_container_width=True):
-        st.session_state.page = "🛡️ Prevention Strategies"
+    # Month arithmetic on datetime64[M] instead of parsing a Year/Month/day frame with to_datetime
+    month_offsets = (monthly_data['Year'].to_numpy(dtype=np.int64) - 1970) * 12 + monthly_data['Month'].to_numpy(dtype=np.int64) - 1
+    monthly_data['Date'] = month_offsets.astype('datetime64[M]').astype('datetime64[ns]')
+    return monthly_data
 
-with col4:
-    if st.button("📊 Benefits", use_container_width=True):
-        st.session_state.page = "🎯 Benefits & Achievements"
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def yearly_totals(df, crimes):
+    """Sum the given crimes per Year over the whole dataset"""
+    return df.groupby('Year', sort=True)[list(crimes)].sum()
 
-# Initialize session state for page
-if 'page' not in st.session_state:
-    st.session_state.page = "🏠 Overview"
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def unit_sum(df, crime):
+    """Sum one crime per Unit, largest first"""
+    return df.groupby('Unit', observed=True)[crime].sum().sort_values(ascending=False)
 
-page = st.session_state.page
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def unit_year_heatmap(df, crime):
+    """Sum one crime per Unit (rows) and Year (columns)"""
+    return df.pivot_table(index='Unit', columns='Year', values=crime, aggfunc='sum', fill_value=0, observed=True).astype('int32')
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def date_sum(df, crimes):
+    """Sum the given crimes per Date"""
+    return df.groupby('Date')[list(crimes)].sum().reset_index()
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def unit_comparison_sum(df, crimes):
+    """Sum the given crimes per Unit"""
+    return df.groupby('Unit', observed=True)[list(crimes)].sum()
+
+def top_k(series, k=5):
+    """Return the k largest entries of a Series, largest first, without sorting the rest"""
+    values = series.to_numpy(dtype=np.float64)
+    k = min(k, len(values))
+    top = np.argpartition(-values, k - 1)[:k]
+    return series.iloc[top[np.argsort(-values[top], kind='stable')]]
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def top_crimes(df, crimes, k=5):
+    """The k most frequent crimes over the whole dataset"""
+    return top_k(df[list(crimes)].sum(), k)
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def crime_correlations(df, crimes):
+    """Pearson correlations between every pair of the given crimes"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Constant columns become NaN, as with DataFrame.corr
+        corr = np.atleast_2d(np.corrcoef(df[list(crimes)].to_numpy(dtype=np.float64), rowvar=False))
+    return pd.DataFrame(corr, index=list(crimes), columns=list(crimes))
+
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def unit_index(df):
+    """Map each Unit to the row positions it occupies"""
+    units = df['Unit']
+    return units.groupby(units, sort=False, observed=True).indices
+
+@st.cache_resource(hash_funcs={pd.DataFrame: id})
+def crime_matrix(df, crimes):
+    """Crime counts as one shared, read-only (rows, crimes) float32 array"""
+    matrix = df[list(crimes)].to_numpy(dtype=np.float32)
+    matrix.flags.writeable = False
+    return matrix
+
+@st.cache_data(hash_funcs={pd.DataFrame: id})
+def recent_top_crimes(df, unit, crimes, months=24, k=5):
+    """Top k crimes for a unit over its last `months` rows"""
+    positions = unit_index(df).get(unit, [])[-months:]
+    sums = df[list(crimes)].to_numpy()[positions].sum(axis=0, dtype=np.int64)
+    return top_k(pd.Series(sums, index=crimes), k)
+
+# Cached Plotly figures, keyed by the aggregated data they plot and their labels
+@st.cache_data(show_spinner=False)
+def monthly_trend_figure(monthly_data, crime, start_year, end_year):
+    """Line chart of one crime per month"""
+    fig = px.line(monthly_data, x='Date', y=crime, 
+                  title=f'Monthly {crime} Trends ({start_year}-{end_year})',
+                  markers=True, render_mode='webgl')
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def yearly_figure(yearly_data):
+    """Grouped bar chart of every crime per year"""
+    fig = px.bar(yearly_data, title="Yearly Crime Comparison")
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def unit_bar_figure(unit_data, crime):
+    """Bar chart of one crime per police unit"""
+    fig = px.bar(x=unit_data.index, y=unit_data.values,
+                 title=f'{crime} by Police Unit',
+                 labels={'x': 'Police Unit', 'y': 'Total Cases'})
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def heatmap_figure(heatmap_data, crime):
+    """Unit-by-year heatmap of one crime"""
+    title = f'{crime} Heatmap: Unit vs Year'
+    if heatmap_data.size > MAX_HEATMAP_CELLS:
+        fig = image_heatmap(heatmap_data, 'plasma', title, aspect='auto')
+    else:
+        fig = px.imshow(heatmap_data, 
+                        title=title,
+                        aspect='auto')
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def prediction_bar_figure(top_5_crimes, unit, month, year):
+    """Bar chart of the top 5 predicted crimes"""
+    fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
+                title=f'Top 5 Crime Predictions for {unit} - {pd.Timestamp(2020, month, 1).strftime("%B")} {year}',
+                labels={'x': 'Crime Type', 'y': 'Predicted Cases'})
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def prediction_pie_figure(top_5_crimes):
+    """Pie chart of the top 5 predicted crimes"""
+    fig = px.pie(values=top_5_crimes.values, names=top_5_crimes.index,
+                title="Prediction Distribution")
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def recent_trend_figure(recent_trend, unit):
+    """Bar chart of a unit's top crimes over the last 24 months"""
+    return px.bar(x=recent_trend.index, y=recent_trend.values,
+                  title=f"Historical Crime Trends for {unit} (Last 24 Months)")
+
+@st.cache_data(show_spinner=False)
+def time_series_figure(ts_data, crimes):
+    """One line per selected crime over time"""
+    dates = ts_data['Date'].to_numpy()
+    traces = []
+    for crime in crimes:
+        # Long series are thinned with LTTB so the browser gets at most MAX_LINE_POINTS per trace
+        values = ts_data[crime].to_numpy()
+        keep = lttb_indices(dates, values, MAX_LINE_POINTS)
+        traces.append(go.Scattergl(x=dates[keep], y=values[keep], mode='lines+markers', name=crime))
+    
+    # Build the figure from the whole trace list in one call rather than growing it trace by trace
+    fig = go.Figure(data=traces)
+    fig.update_layout(title="Crime Trends Over Time", height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def correlation_figure(correlation_matrix):
+    """Heatmap of the correlations between the selected crimes"""
+    title = "Correlation Matrix of Selected Crime Types"
+    if correlation_matrix.size > MAX_HEATMAP_CELLS:
+        fig = image_heatmap(correlation_matrix, 'RdBu_r', title)
+    else:
+        fig = px.imshow(correlation_matrix, 
+                        title=title,
+                        color_continuous_scale='RdBu_r')
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def unit_comparison_figure(unit_comparison):
+    """Grouped bar chart of the selected crimes per unit"""
+    fig = px.bar(unit_comparison, title="Crime Comparison Across Units")
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def top_crimes_figure(top_5_crimes):
+    """Bar chart of the five most frequent crimes"""
+    fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
+                 title="Top 5 Crime Types by Volume",
+                 color=top_5_crimes.values,
+                 color_continuous_scale='viridis')
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def crime_share_figure(crime_percentages):
+    """Pie chart of the top crimes' share of cases"""
+    fig = px.pie(values=crime_percentages.values, names=crime_percentages.index,
+                 title="Crime Distribution (%)")
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def resource_allocation_figure(resource_allocation):
+    """Bar chart of the recommended resource split"""
+    fig = px.bar(x=resource_allocation.index, y=resource_allocation.values,
+                 title="Recommended Resource Allocation (%)",
+                 color=resource_allocation.values,
+                 color_continuous_scale='plasma')
+    fig.update_layout(height=400)
+    return fig
 
 # Load data (we'll need to run the main script first to generate data)
-@st.cache_data
+# One DataFrame is shared by every rerun and session without a pickle round-trip, so it must never be mutated
+@st.cache_resource
 def load_data():
     try:
-        # Try to load the processed data
-        df = pd.read_csv('crime_data_processed.csv')
-        return df
-    except:
+        # Prefer the typed Parquet copy from prepare_data.py, unless the CSV has changed since
+        try:
+            if parquet_is_current(PARQUET_PATH, CSV_PATH):
+                df = pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+            else:
+                df = load_csv(CSV_PATH)
+        except ImportError:
+            # Without pyarrow, read the processed CSV, typed the same way prepare_data.py types the Parquet file
+            df = load_csv(CSV_PATH)
+        
+        # Selectbox options, worked out once per load rather than rescanning columns on each rerun
+        years = tuple(int(year) for year in np.unique(df['Year'].to_numpy()))
+        units = tuple(df['Unit'].astype('category').cat.categories)
+        return df, years, units
+    except (FileNotFoundError, ImportError, pd.errors.ParserError):
         st.error("Please run the main data visualization script first to generate the required data files.")
-        return None
+        return None, (), ()
 
 # Load data
-df = load_data()
+df, years, units = load_data()
 
 if df is None:
     st.error("""
@@ -144,49 +310,27 @@ if df is None:
     """)
     st.stop()
 
-# Process the data to add Year and Month columns
-df['Date'] = pd.to_datetime(df['Date'])
-df['Year'] = df['Date'].dt.year
-df['Month'] = df['Date'].dt.month
+# Crime count columns, shared by every page; a tuple so it can key cached helpers directly
+crime_cols = get_crime_cols(tuple(df.columns))
 
 # Overview Page
-if page == "🏠 Overview":
+def render_overview(df, crime_cols):
     st.markdown("## 📊 Crime Data Overview")
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Total Records</h3>
-            <h2>{len(df):,}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Total Records", f"{len(df):,}")
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Date Range</h3>
-            <h2>{df['Date'].min().strftime('%Y-%m')} - {df['Date'].max().strftime('%Y-%m')}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Date Range", f"{df['Date'].min().strftime('%Y-%m')} - {df['Date'].max().strftime('%Y-%m')}")
     
     with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Police Units</h3>
-            <h2>{df['Unit'].nunique()}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Police Units", df['Unit'].nunique())
     
     with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Crime Types</h3>
-            <h2>{len([col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']])}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Crime Types", len(crime_cols))
     
     # Data preview
     st.markdown("### 📋 Data Preview")
@@ -194,81 +338,68 @@ if page == "🏠 Overview":
     
     # Summary statistics
     st.markdown("### 📈 Summary Statistics")
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    st.dataframe(df[numeric_cols].describe(), use_container_width=True)
+    st.dataframe(numeric_summary(df), use_container_width=True)
 
 # Crime Trends Page
-elif page == "📈 Crime Trends":
+@st.fragment
+def render_trends(df, crime_cols, years):
     st.markdown("## 📈 Crime Trends Analysis")
     
     # Time period selector
     col1, col2 = st.columns(2)
     with col1:
-        start_year = st.selectbox("Start Year", sorted(df['Year'].unique()))
+        start_year = st.selectbox("Start Year", years)
     with col2:
-        end_year = st.selectbox("End Year", sorted(df['Year'].unique()), index=len(sorted(df['Year'].unique()))-1)
-    
-    # Filter data
-    filtered_df = df[(df['Year'] >= start_year) & (df['Year'] <= end_year)]
+        end_year = st.selectbox("End Year", years, index=len(years)-1)
     
     # Monthly trends
     st.markdown("### 📅 Monthly Crime Trends")
     
-    # Get crime columns
-    crime_cols = [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
-    
     selected_crime = st.selectbox("Select Crime Type", crime_cols)
     
     # Monthly aggregation
-    monthly_data = filtered_df.groupby(['Year', 'Month'])[selected_crime].sum().reset_index()
-    monthly_data['Date'] = pd.to_datetime(monthly_data[['Year', 'Month']].assign(day=1))
+    monthly_data = monthly_sum(df, selected_crime, start_year, end_year)
     
-    fig = px.line(monthly_data, x='Date', y=selected_crime, 
-                  title=f'Monthly {selected_crime} Trends ({start_year}-{end_year})',
-                  markers=True)
-    fig.update_layout(height=500)
+    fig = monthly_trend_figure(monthly_data, selected_crime, start_year, end_year)
     st.plotly_chart(fig, use_container_width=True)
     
     # Year-over-year comparison
     st.markdown("### 📊 Year-over-Year Comparison")
     
-    yearly_data = filtered_df.groupby('Year')[crime_cols].sum()
+    yearly_data = yearly_totals(df, crime_cols).loc[start_year:end_year]
     
-    fig = px.bar(yearly_data, title="Yearly Crime Comparison")
-    fig.update_layout(height=500)
+    fig = yearly_figure(yearly_data)
     st.plotly_chart(fig, use_container_width=True)
 
 # Geographic Analysis Page
-elif page == "🗺️ Geographic Analysis":
+@st.fragment
+def render_geographic(df, crime_cols):
     st.markdown("## 🗺️ Geographic Crime Analysis")
     
     # Unit-wise analysis
     st.markdown("### 🏢 Crime by Police Unit")
     
-    selected_crime_geo = st.selectbox("Select Crime Type for Geographic Analysis", 
-                                    [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']])
+    selected_crime_geo = st.selectbox("Select Crime Type for Geographic Analysis", crime_cols)
     
-    unit_data = df.groupby('Unit')[selected_crime_geo].sum().sort_values(ascending=False)
+    unit_data = unit_sum(df, selected_crime_geo)
     
-    fig = px.bar(x=unit_data.index, y=unit_data.values,
-                 title=f'{selected_crime_geo} by Police Unit',
-                 labels={'x': 'Police Unit', 'y': 'Total Cases'})
-    fig.update_layout(height=500)
+    fig = unit_bar_figure(unit_data, selected_crime_geo)
     st.plotly_chart(fig, use_container_width=True)
     
     # Heatmap
     st.markdown("### 🔥 Crime Heatmap by Unit and Year")
     
-    heatmap_data = df.groupby(['Unit', 'Year'])[selected_crime_geo].sum().unstack(fill_value=0)
+    heatmap_data = unit_year_heatmap(df, selected_crime_geo)
     
-    fig = px.imshow(heatmap_data, 
-                    title=f'{selected_crime_geo} Heatmap: Unit vs Year',
-                    aspect='auto')
-    fig.update_layout(height=500)
+    fig = heatmap_figure(heatmap_data, selected_crime_geo)
     st.plotly_chart(fig, use_container_width=True)
 
+# Seasonal adjustment indexed by month number (index 0 is unused)
+SEASONAL_FACTORS = np.array([1.0, 1.1, 0.9, 1.0, 1.05, 1.1, 1.15, 1.2, 1.1, 1.05, 1.0, 0.95, 0.9], dtype=np.float32)
+
 # Crime Predictions Page
-elif page == "🔮 Crime Predictions":
+@st.fragment
+def render_predictions(df, crime_cols, units):
     st.markdown("## 🔮 Crime Prediction System")
     
     # Prediction controls
@@ -286,73 +417,49 @@ elif page == "🔮 Crime Predictions":
     
     with col3:
         prediction_unit = st.selectbox("Select Police Unit", 
-                                     sorted(df['Unit'].unique()))
+                                     units)
     
     # Prediction button
     if st.button("🔮 Generate Predictions", type="primary"):
         st.markdown("### 📊 Top 5 Crime Predictions")
         
-        # Get crime types
-        crime_types = [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
-        
         # Get historical data for the selected unit
-        unit_data = df[df['Unit'] == prediction_unit]
+        positions = unit_index(df).get(prediction_unit, [])
         
-        if len(unit_data) > 0:
-            # Calculate historical averages and trends
-            historical_avg = unit_data[crime_types].mean()
+        if len(positions) > 0:
+            # Calculate historical averages and trends from one (months, crimes) matrix
+            crime_types = np.asarray(crime_cols)
+            counts = crime_matrix(df, crime_cols)[positions]
+            historical_avg = pd.Series(counts.mean(axis=0, dtype=np.float64), index=crime_types)
             
-            # Add seasonal adjustment based on month
-            seasonal_factors = {
-                1: 1.1, 2: 0.9, 3: 1.0, 4: 1.05, 5: 1.1, 6: 1.15,
-                7: 1.2, 8: 1.1, 9: 1.05, 10: 1.0, 11: 0.95, 12: 0.9
-            }
-            
-            # Calculate trend (simple linear trend)
-            recent_data = unit_data.tail(12)  # Last 12 months
-            if len(recent_data) > 1:
-                trend_factors = {}
-                for crime in crime_types:
-                    if recent_data[crime].sum() > 0:
-                        # Simple trend calculation
-                        trend = (recent_data[crime].iloc[-1] - recent_data[crime].iloc[0]) / len(recent_data)
-                        trend_factors[crime] = 1 + (trend * 0.1)  # Scale down the trend
-                    else:
-                        trend_factors[crime] = 1.0
+            # Calculate trend (simple linear trend) over the last 12 months; a unit's rows are in date order
+            recent = counts[-12:]
+            if len(recent) > 1:
+                trend = (recent[-1] - recent[0]) / len(recent)
+                trend_factors = np.where(recent.sum(axis=0) > 0, 1 + trend * 0.1, 1.0)  # Scale down the trend
             else:
-                trend_factors = {crime: 1.0 for crime in crime_types}
+                trend_factors = np.ones(len(crime_types))
             
-            # Generate predictions
-            predictions = {}
-            for crime in crime_types:
-                base_prediction = historical_avg[crime]
-                seasonal_adj = seasonal_factors.get(prediction_month, 1.0)
-                trend_adj = trend_factors.get(crime, 1.0)
-                
-                # Add some randomness for realistic predictions
-                random_factor = np.random.uniform(0.85, 1.15)
-                
-                predictions[crime] = base_prediction * seasonal_adj * trend_adj * random_factor
+            # Generate predictions, with some randomness for realistic predictions
+            # Seeded from the selection so the same unit/month/year always gives the same result
+            rng = np.random.default_rng([prediction_year, prediction_month, zlib.crc32(str(prediction_unit).encode())])
+            random_factors = rng.uniform(0.85, 1.15, size=len(crime_types))
+            predictions = historical_avg.to_numpy() * SEASONAL_FACTORS[prediction_month] * trend_factors * random_factors
             
             # Get top 5
-            top_5_crimes = pd.Series(predictions).nlargest(5)
+            top_5_crimes = top_k(pd.Series(predictions, index=crime_types))
             
             # Display predictions
             col1, col2 = st.columns([2, 1])
             
             with col1:
                 # Bar chart
-                fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
-                            title=f'Top 5 Crime Predictions for {prediction_unit} - {pd.Timestamp(2020, prediction_month, 1).strftime("%B")} {prediction_year}',
-                            labels={'x': 'Crime Type', 'y': 'Predicted Cases'})
-                fig.update_layout(height=400)
+                fig = prediction_bar_figure(top_5_crimes, prediction_unit, prediction_month, prediction_year)
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 # Pie chart
-                fig = px.pie(values=top_5_crimes.values, names=top_5_crimes.index,
-                            title="Prediction Distribution")
-                fig.update_layout(height=400)
+                fig = prediction_pie_figure(top_5_crimes)
                 st.plotly_chart(fig, use_container_width=True)
             
             # Prediction table
@@ -360,30 +467,30 @@ elif page == "🔮 Crime Predictions":
             prediction_df = pd.DataFrame({
                 'Crime Type': top_5_crimes.index,
                 'Predicted Cases': top_5_crimes.values.round(1),
-                'Historical Average': [historical_avg[crime].round(1) for crime in top_5_crimes.index],
-                'Confidence Level': [f"{np.random.uniform(0.75, 0.95):.1%}" for _ in range(len(top_5_crimes))]
+                'Historical Average': historical_avg.reindex(top_5_crimes.index).to_numpy().round(1),
+                'Confidence Level': [f"{c:.1%}" for c in rng.uniform(0.75, 0.95, size=len(top_5_crimes))]
             })
             st.dataframe(prediction_df, use_container_width=True)
             
             # Show historical trend
             st.markdown("### 📈 Historical Trend Analysis")
-            recent_trend = unit_data.tail(24)[crime_types].sum().sort_values(ascending=False).head(5)
-            fig = px.bar(x=recent_trend.index, y=recent_trend.values,
-                        title=f"Historical Crime Trends for {prediction_unit} (Last 24 Months)")
+            recent_trend = recent_top_crimes(df, prediction_unit, crime_cols)
+            fig = recent_trend_figure(recent_trend, prediction_unit)
             st.plotly_chart(fig, use_container_width=True)
             
         else:
             st.error(f"No data available for {prediction_unit}")
 
 # Interactive Visualizations Page
-elif page == "📊 Interactive Visualizations":
+@st.fragment
+def render_interactive(df, crime_cols):
     st.markdown("## 📊 Interactive Crime Visualizations")
     
     # Multi-select for crime types
     selected_crimes = st.multiselect(
         "Select Crime Types to Compare",
-        [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']],
-        default=[col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']][:3]
+        crime_cols,
+        default=list(crime_cols[:3])
     )
     
     if selected_crimes:
@@ -391,39 +498,29 @@ elif page == "📊 Interactive Visualizations":
         st.markdown("### 📈 Time Series Comparison")
         
         # Aggregate data
-        ts_data = df.groupby('Date')[selected_crimes].sum().reset_index()
-        ts_data['Date'] = pd.to_datetime(ts_data['Date'])
-        
-        fig = go.Figure()
-        for crime in selected_crimes:
-            fig.add_trace(go.Scatter(x=ts_data['Date'], y=ts_data[crime], 
-                                   mode='lines+markers', name=crime))
+        ts_data = date_sum(df, tuple(selected_crimes))
         
-        fig.update_layout(title="Crime Trends Over Time", height=500)
+        fig = time_series_figure(ts_data, tuple(selected_crimes))
         st.plotly_chart(fig, use_container_width=True)
         
         # Correlation heatmap
         st.markdown("### 🔗 Crime Type Correlations")
         
-        correlation_matrix = df[selected_crimes].corr()
+        correlation_matrix = crime_correlations(df, crime_cols).loc[selected_crimes, selected_crimes]
         
-        fig = px.imshow(correlation_matrix, 
-                        title="Correlation Matrix of Selected Crime Types",
-                        color_continuous_scale='RdBu_r')
-        fig.update_layout(height=500)
+        fig = correlation_figure(correlation_matrix)
         st.plotly_chart(fig, use_container_width=True)
         
         # Unit comparison
         st.markdown("### 🏢 Unit-wise Comparison")
         
-        unit_comparison = df.groupby('Unit')[selected_crimes].sum()
+        unit_comparison = unit_comparison_sum(df, tuple(selected_crimes))
         
-        fig = px.bar(unit_comparison, title="Crime Comparison Across Units")
-        fig.update_layout(height=500)
+        fig = unit_comparison_figure(unit_comparison)
         st.plotly_chart(fig, use_container_width=True)
 
 # Advanced Algorithms Page
-elif page == "🤖 Advanced Algorithms":
+def render_algorithms(df, crime_cols):
     st.markdown("## 🤖 Advanced Machine Learning Algorithms")
     
     # Algorithm overview
@@ -532,13 +629,10 @@ elif page == "🤖 Advanced Algorithms":
     st.plotly_chart(fig, use_container_width=True)
 
 # Prevention Strategies Page
-elif page == "🛡️ Prevention Strategies":
+@st.fragment
+def render_prevention(df, crime_cols):
     st.markdown("## 🛡️ Crime Prevention Strategies")
     
-    # Get crime data for analysis
-    crime_columns = [col for col in df.columns if col not in ['Date', 'Unit', 'Year', 'Month']]
-    total_crimes = df[crime_columns].sum().sort_values(ascending=False)
-    
     # Top crime types
     st.markdown("### 🎯 Top Crime Types Requiring Prevention")
     
@@ -546,20 +640,14 @@ elif page == "🛡️ Prevention Strategies":
     
     with col1:
         # Top 5 crimes chart
-        top_5_crimes = total_crimes.head(5)
-        fig = px.bar(x=top_5_crimes.index, y=top_5_crimes.values,
-                     title="Top 5 Crime Types by Volume",
-                     color=top_5_crimes.values,
-                     color_continuous_scale='viridis')
-        fig.update_layout(height=400)
+        top_5_crimes = top_crimes(df, crime_cols)
+        fig = top_crimes_figure(top_5_crimes)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Crime percentages
         crime_percentages = (top_5_crimes / top_5_crimes.sum() * 100).round(1)
-        fig = px.pie(values=crime_percentages.values, names=crime_percentages.index,
-                     title="Crime Distribution (%)")
-        fig.update_layout(height=400)
+        fig = crime_share_figure(crime_percentages)
         st.plotly_chart(fig, use_container_width=True)
     
     # Prevention strategies
@@ -635,11 +723,7 @@ elif page == "🛡️ Prevention Strategies":
     # Calculate resource allocation based on crime percentages
     resource_allocation = crime_percentages.head(5).copy()
     
-    fig = px.bar(x=resource_allocation.index, y=resource_allocation.values,
-                 title="Recommended Resource Allocation (%)",
-                 color=resource_allocation.values,
-                 color_continuous_scale='plasma')
-    fig.update_layout(height=400)
+    fig = resource_allocation_figure(resource_allocation)
     st.plotly_chart(fig, use_container_width=True)
     
     # Success metrics
@@ -655,7 +739,7 @@ elif page == "🛡️ Prevention Strategies":
     st.dataframe(success_df, use_container_width=True)
 
 # Benefits & Achievements Page
-elif page == "🎯 Benefits & Achievements":
+def render_benefits(df, crime_cols):
     st.markdown("## 🎯 Benefits & Achievements")
     
     # Overall impact summary
@@ -761,10 +845,23 @@ elif page == "🎯 Benefits & Achievements":
     timeline_df = pd.DataFrame(timeline_data)
     st.dataframe(timeline_df, use_container_width=True)
 
+# Pages with widgets are fragments, so changing a selection reruns only that page
+PAGE_RENDERERS = {
+    "🏠 Overview": lambda: render_overview(df, crime_cols),
+    "📈 Crime Trends": lambda: render_trends(df, crime_cols, years),
+    "🗺️ Geographic Analysis": lambda: render_geographic(df, crime_cols),
+    "🔮 Crime Predictions": lambda: render_predictions(df, crime_cols, units),
+    "📊 Interactive Visualizations": lambda: render_interactive(df, crime_cols),
+    "🤖 Advanced Algorithms": lambda: render_algorithms(df, crime_cols),
+    "🛡️ Prevention Strategies": lambda: render_prevention(df, crime_cols),
+    "🎯 Benefits & Achievements": lambda: render_benefits(df, crime_cols),
+}
+PAGE_RENDERERS[page]()
+
 # Footer
 st.markdown("---")
 st.markdown("""
-<div style='text-align: center; color: #666;'>
+<div class="footer">
     <p>🚔 Crime Analysis Dashboard | Built with Streamlit | Data Science Project</p>
 </div>
 """, unsafe_allow_html=True)
@@ -51,6 +51,7 @@ def main():
         print("- dashboard_components.py")
         print("- dashboard_pages.py")
         print("- dashboard_main.py")
+        print("- prepare_data.py")
 
 if __name__ == "__main__":
     main()